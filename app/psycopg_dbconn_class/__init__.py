@@ -19,5 +19,14 @@
 # Imports
 from .src.psycopg_dbconn_class import DataBaseConnection
 
+
+def __getattr__(name: str):
+	# AsyncDataBaseConnection is only imported on demand, since it depends on the optional asyncpg library
+	if name == 'AsyncDataBaseConnection':
+		from .src.async_psycopg_dbconn_class import AsyncDataBaseConnection
+		return AsyncDataBaseConnection
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 # Lib current version
 __version__ = '0.0.2'
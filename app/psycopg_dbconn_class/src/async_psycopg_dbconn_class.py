@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Kleydson Stenio <kleydson.stenio@gmail.com>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+# Imports
+try:
+	import asyncpg
+except ImportError as ie:
+	print(
+		'Please install asyncpg library in order to use this class.\n'
+		'Check: https://pypi.org/project/asyncpg/')
+	raise ie
+else:
+	import asyncio
+	import logging
+	from typing import Sequence
+	from pathlib import Path
+	from .dbconn_config import DataBaseConfig
+
+
+_log = logging.getLogger(__name__)
+
+
+# Main Class
+class AsyncDataBaseConnection(DataBaseConfig):
+	__slots__ = ('__min_size', '__max_size', '__statement_cache_size', '__lock', 'connected', '_pool')
+	
+	def __init__(
+			self, config_file: Path = None, auto_config: bool = True, auto_config_mode: str = 'env',
+			min_size: int = 5, max_size: int = 20, statement_cache_size: int = 1024):
+		"""
+		AsyncDataBaseConnection constructor (queries use the native Postgres placeholders: $1, $2, ...)
+		:param config_file: location (pathlib) of JSON config file
+		:param auto_config: if the config parameters will be loaded on object creation
+		:param auto_config_mode: mode for auto config, 'env' or 'json'
+		:param min_size: minimum number of connections kept open by the pool
+		:param max_size: maximum number of connections the pool may open
+		:param statement_cache_size: size of the prepared statement cache of each connection
+		"""
+		if not 0 < min_size <= max_size:
+			raise ValueError(f'Invalid pool size: expected 0 < min_size <= max_size, found {min_size} and {max_size}.')
+		super().__init__()
+		self.connected = False
+		self._pool = None
+		# Created on first connect, so it belongs to the running event loop (Python 3.9 binds locks on creation)
+		self.__lock = None
+		self.__min_size = min_size
+		self.__max_size = max_size
+		self.__statement_cache_size = statement_cache_size
+		if auto_config:
+			if auto_config_mode == 'env':
+				self.update_config_values_from_env()
+			elif auto_config_mode == 'json':
+				self.update_config_values_from_json(config_file)
+	
+	async def connect(self):
+		"""
+		Simple coroutine for database connection (object must have proper config before connecting)
+		:return:
+		"""
+		if self.__lock is None:
+			self.__lock = asyncio.Lock()
+		# Lock avoids concurrent lazy connects (e.g. asyncio.gather) creating (and leaking) a pool each
+		async with self.__lock:
+			if not self.connected:
+				# Check if all parameters were set before connecting (empty or missing values are falsy)
+				if all(self._config):
+					try:
+						self._pool = await asyncpg.create_pool(
+							database=self._config.db_name,
+							host=self._config.db_host,
+							port=int(self._config.db_port),
+							user=self._config.db_user,
+							password=self._config.db_pass,
+							min_size=self.__min_size,
+							max_size=self.__max_size,
+							statement_cache_size=self.__statement_cache_size)
+					except (OSError, asyncpg.PostgresError) as err:
+						_log.exception('Could not connect to the database _%s_', self._config.db_name)
+						raise err
+					else:
+						self.connected = True
+						_log.info(
+							'Successfully connected to the Postgres Database _%s_ on %s:%s',
+							self._config.db_name, self._config.db_host, self._config.db_port)
+				else:
+					raise ValueError(
+						'Please, setup connection parameters before trying to connect to a server! '
+						'Tip: run the methods update_config_values or update_config_values_from_json')
+	
+	async def run_query(self, query: str, values: Sequence = None, force: bool = True, do_print: bool = False):
+		"""
+		Coroutine for running queries on connected database. Obs.: This does not return values
+		:param query: the query itself
+		:param values: values to pass to query
+		:param force: will attempt to force database connection
+		:param do_print: will log executed query at INFO level (DEBUG otherwise)
+		:return:
+		"""
+		if force:
+			if not self.connected:
+				await self.connect()
+		if self.connected:
+			async with self._pool.acquire() as conn:
+				if values is None:
+					await conn.execute(query)
+				else:
+					await conn.execute(query, *values)
+			_log.log(
+				logging.INFO if do_print else logging.DEBUG,
+				'Query **%s** executed in _%s_', query, self._config.db_name)
+		else:
+			raise ConnectionError('There is no Database connected')
+	
+	async def copy_from_iter(self, table: str, columns: list, rows, schema: str = None, force: bool = True):
+		"""
+		Coroutine for bulk ingest using the binary COPY protocol (asyncpg copy_records_to_table)
+		:param table: name of the table
+		:param columns: names of the columns, in the same order of the values of each row
+		:param rows: iterable (or async iterable) of rows (each one a sequence of values, None being NULL)
+		:param schema: schema of the table (optional)
+		:param force: will attempt to force database connection
+		:return:
+		"""
+		if force:
+			if not self.connected:
+				await self.connect()
+		if self.connected:
+			async with self._pool.acquire() as conn:
+				await conn.copy_records_to_table(table, records=rows, columns=columns, schema_name=schema)
+		else:
+			raise ConnectionError('There is no Database connected')
+	
+	async def run_read_query(self, query: str, values: Sequence = None, force: bool = True, fetch_all: bool = False):
+		"""
+		Similar to run_query, but returns values obtained from database (as asyncpg Records)
+		:param query: the query itself
+		:param values: values to pass to query
+		:param force: will attempt to force database connection
+		:param fetch_all: catches all rows (or just a single one)
+		:return:
+		"""
+		if force:
+			if not self.connected:
+				await self.connect()
+		if self.connected:
+			values = () if values is None else values
+			async with self._pool.acquire() as conn:
+				if fetch_all:
+					return await conn.fetch(query, *values)
+				return await conn.fetchrow(query, *values)
+		raise ConnectionError('There is no Database connected')
+	
+	async def run_pipeline(self, queries: list, force: bool = True) -> list:
+		"""
+		Coroutine for running many queries concurrently, each one on its own connection of the pool. Obs.: queries
+		are not part of the same transaction, so they must not depend on each other
+		:param queries: sequence of (query, values) tuples, values being None for queries without parameters
+		:param force: will attempt to force database connection
+		:return: list with the rows returned by each query (in the same order of queries)
+		"""
+		if force:
+			if not self.connected:
+				await self.connect()
+		if self.connected:
+			return list(await asyncio.gather(*[
+				self.run_read_query(query, values, force=False, fetch_all=True) for query, values in queries]))
+		raise ConnectionError('There is no Database connected')
+	
+	async def close(self):
+		"""
+		Simple coroutine for closing every connection of the pool
+		:return:
+		"""
+		if self.connected:
+			await self._pool.close()
+			self._pool = None
+			self.connected = False
+			_log.info('Closed connection to _%s_', self._config.db_name)
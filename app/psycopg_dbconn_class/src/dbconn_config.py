@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Kleydson Stenio <kleydson.stenio@gmail.com>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+# Imports
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+
+class _Cfg(NamedTuple):
+	"""
+	Connection/config values (the same fields accepted in the JSON config file)
+	"""
+	db_name: str
+	db_host: str
+	db_port: str
+	db_user: str
+	db_pass: str
+
+
+# Config Mixin
+class DataBaseConfig(object):
+	__slots__ = ('_config', '_dsn')
+	__default_keys = ('DBN', 'DBU', 'DBK', 'DBH', 'DBP')
+	__dsn_keys = ('dbname', 'host', 'port', 'user', 'password')
+	
+	def __init__(self):
+		"""
+		DataBaseConfig constructor (shared by sync and async connection classes)
+		"""
+		self._config = _Cfg('', '', '', '', '')
+		self._dsn = ''
+	
+	@staticmethod
+	def __quote(value) -> str:
+		# Quotes a conninfo value following libpq rules (backslash escapes quotes and backslashes)
+		value = '' if value is None else str(value)
+		return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+	
+	def _build_dsn(self):
+		"""
+		Builds the libpq connection string (DSN) from the current config values, so connecting does not need to
+		rebuild it every time
+		:return:
+		"""
+		self._dsn = ' '.join([f'{key}={self.__quote(value)}' for key, value in zip(self.__dsn_keys, self._config)])
+	
+	def update_config_values(self, name: str, host: str, port: str, user: str, password: str):
+		"""
+		Method for handling change of connection/config values
+		:param name: name of database
+		:param host: ip/host of database
+		:param port: database port
+		:param user: database user
+		:param password: database password
+		:return:
+		"""
+		self._config = _Cfg(name, host, port, user, password)
+		self._build_dsn()
+	
+	def update_config_value(self, key: str, value: str):
+		"""
+		Method for updating a single config value of object
+		:param key: the key to update
+		:param value: the value of the key
+		:return:
+		"""
+		self._config = self._config._replace(**{key: value})
+		self._build_dsn()
+	
+	def update_config_values_from_json(self, config_file: Path = None):
+		"""
+		Method for updating config values from JSON
+		:param config_file: the JSON file Path
+		:return:
+		"""
+		# Checks if user entered config_file parameter
+		if config_file is None:
+			candidate_file = Path(__file__).parent.joinpath('conn.json')
+		else:
+			candidate_file = config_file
+		# Now, checks if candidate_file exists
+		if candidate_file.is_file():
+			# JSON parser is only imported when needed (orjson, if installed)
+			try:
+				import orjson as json
+			except ImportError:
+				import json
+			loaded_config = json.loads(candidate_file.read_bytes())
+			# With json file loaded, we must guarantee that the correct fields exists (missing/unknown raise TypeError)
+			try:
+				self._config = _Cfg(**loaded_config)
+			except TypeError:
+				raise ValueError(
+					f'The json file ({candidate_file.name}) does not have the '
+					f'needed/correct fields to connect into the DB .\n'
+					f'Needed values: {str(_Cfg._fields)}')
+			self._build_dsn()
+		else:
+			raise FileNotFoundError(
+				f'Could not find the _{candidate_file.absolute()}_ file')
+	
+	def update_config_values_from_env(self, env_keys: tuple = None):
+		"""
+		Method for updating config values from environment variables
+		:param env_keys: the keys being used in environment. Tuple is loaded in order:
+			db_name, db_user, db_pass, db_host, db_port (0, 1, 2, 3, 4)
+		:return:
+		"""
+		# Checks env keys
+		if env_keys is None:
+			env_keys = self.__default_keys
+		elif len(env_keys) != 5:
+			raise AssertionError('Illegal size for env_keys! (!= 5)')
+		self._config = _Cfg(
+			db_name=os.environ.get(env_keys[0]),
+			db_user=os.environ.get(env_keys[1]),
+			db_pass=os.environ.get(env_keys[2]),
+			db_host=os.environ.get(env_keys[3]),
+			db_port=os.environ.get(env_keys[4]))
+		self._build_dsn()
+	
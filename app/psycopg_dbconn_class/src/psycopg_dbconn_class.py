@@ -25,20 +25,112 @@ except ImportError as ie:
 		'Check: https://pypi.org/project/psycopg2-binary/')
 	raise ie
 else:
-	import os
-	import json
-	import psycopg2.extras
+	import re
+	import logging
+	import psycopg2.pool
+	import psycopg2.extensions
+	import weakref
+	import threading
+	from psycopg2 import sql
+	from uuid import UUID, uuid4
+	from decimal import Decimal
+	from datetime import date, time
+	from typing import Mapping, Sequence, Union
 	from pathlib import Path
+	from functools import lru_cache
+	from itertools import groupby
+	from collections import OrderedDict
+	from contextlib import contextmanager
+	from .dbconn_config import DataBaseConfig
+
+
+_log = logging.getLogger(__name__)
+
+# psycopg2 placeholders: escaped percent (%%), positional (%s) and named (%(name)s)
+_PH = re.compile(r'%(?:%|s|\(([^)]*)\)s)')
+
+
+@lru_cache(maxsize=1024)
+def _translate_placeholders(query: str):
+	"""
+	Translates psycopg2 placeholders (%s or %(name)s) into Postgres ones ($1, $2, ...), in a single regex pass.
+	Results are cached, so a query is translated only once (even if prepared on many connections)
+	:param query: the query itself
+	:return: tuple with translated query and parameters, being their number (positional) or names (named),
+		or None if query can not be translated (mixed or unknown placeholders)
+	"""
+	# Unknown placeholders (e.g. %d) are left for psycopg2 to complain about
+	if '%' in _PH.sub('', query):
+		return None
+	names, count = {}, 0
+	
+	def replace(match):
+		nonlocal count
+		if match[0] == '%%':
+			return '%'
+		if match[1] is None:
+			count += 1
+			return f'${count}'
+		# The same named parameter may appear many times, but is bound only once
+		if match[1] not in names:
+			names[match[1]] = len(names) + 1
+		return f'${names[match[1]]}'
+	
+	translated = _PH.sub(replace, query)
+	if count and names:
+		return None
+	return translated, tuple(names) if names else count
+
+
+class _CopyRowsStream(object):
+	"""
+	Minimal file-like object that renders rows as COPY text lines on demand (used by COPY ... FROM STDIN)
+	"""
+	# Types whose str() is a valid Postgres input (datetime is a subclass of date, bool of int)
+	__text_types = (str, int, float, Decimal, date, time, UUID)
+	
+	def __init__(self, rows):
+		self.__rows = iter(rows)
+		self.__pending = ''
+	
+	@classmethod
+	def __format(cls, value) -> str:
+		if value is None:
+			return '\\N'
+		if isinstance(value, (bytes, bytearray, memoryview)):
+			# bytea hex format, with its backslash escaped for the COPY text format
+			return '\\\\x' + bytes(value).hex()
+		if not isinstance(value, cls.__text_types):
+			raise TypeError(
+				f'Can not copy values of type {type(value).__name__}. '
+				f'Expected str, int, float, Decimal, date, time, datetime, UUID, bytes or None.')
+		return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+	
+	def read(self, size: int = -1) -> str:
+		while size < 0 or len(self.__pending) < size:
+			try:
+				row = next(self.__rows)
+			except StopIteration:
+				break
+			self.__pending += '\t'.join([self.__format(value) for value in row]) + '\n'
+		if size < 0:
+			size = len(self.__pending)
+		chunk, self.__pending = self.__pending[:size], self.__pending[size:]
+		return chunk
 
 
 # Main Class
-class DataBaseConnection(object):
-	__default_keys = ('DBN', 'DBU', 'DBK', 'DBH', 'DBP')
-	__default_cursor = ''
+class DataBaseConnection(DataBaseConfig):
+	# Private names are mangled by Python (e.g. __minconn is stored as _DataBaseConnection__minconn)
+	__slots__ = (
+		'__default_cursor', '__statement_cache_size', '__minconn', '__maxconn', '__autocommit', '__lock',
+		'cursor', 'connection', 'connected', '_pool', '_stmt_cache', '_rendered')
+	__preparable_commands = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'VALUES', 'WITH')
 	
 	def __init__(
 			self, config_file: Path = None, auto_config: bool = True, auto_config_mode: str = 'env',
-			auto_connect: bool = False, default_cursor: str = ''):
+			auto_connect: bool = False, default_cursor: str = '', minconn: int = 1, maxconn: int = 10,
+			statement_cache_size: int = 256, autocommit: bool = False):
 		"""
 		DataBaseConnection constructor
 		:param config_file: location (pathlib) of JSON config file
@@ -46,6 +138,12 @@ class DataBaseConnection(object):
 		:param auto_config_mode: mode for auto config, 'env' or 'json'
 		:param auto_connect: if class will try to connect on creation
 		:param default_cursor: default cursor for queries return, 'realdict' (default) or 'dict'
+		:param minconn: number of connections opened right away on connect (one of them pinned to self.connection)
+			and then kept idle for reuse by the pool. Connections returned while minconn connections are already idle
+			are closed, so it should match the expected concurrency
+		:param maxconn: maximum number of connections the pool may open for queries
+		:param statement_cache_size: server-side prepared statements kept per connection (0 disables the cache)
+		:param autocommit: if write queries run in autocommit mode (read queries always do)
 		"""
 		# Checks errors
 		if not isinstance(default_cursor, str):
@@ -54,11 +152,21 @@ class DataBaseConnection(object):
 				f'Expected *str*, found **{default_cursor.__class__.__name__}**.')
 		if default_cursor.lower() not in ('', 'realdict', 'dict'):
 			raise ValueError('Invalid value for cursor_type parameter. Accepted values are "realdict" and "dict".')
-		self.__config = {'db_name': '', 'db_host': '', 'db_port': '', 'db_user': '', 'db_pass': ''}
+		if not 0 < minconn <= maxconn:
+			raise ValueError(f'Invalid pool size: expected 0 < minconn <= maxconn, found {minconn} and {maxconn}.')
+		super().__init__()
 		self.__default_cursor = default_cursor
 		self.cursor = None
 		self.connection = None
 		self.connected = False
+		self._pool = None
+		self._stmt_cache = {}
+		self._rendered = {}
+		self.__statement_cache_size = statement_cache_size
+		self.__minconn = minconn
+		self.__maxconn = maxconn
+		self.__autocommit = autocommit
+		self.__lock = threading.Lock()
 		if auto_config:
 			if auto_config_mode == 'env':
 				self.update_config_values_from_env()
@@ -67,194 +175,421 @@ class DataBaseConnection(object):
 			if auto_connect:
 				self.connect()
 	
-	def update_config_values(self, name: str, host: str, port: str, user: str, password: str):
-		"""
-		Method for handling change of connection/config values
-		:param name: name of database
-		:param host: ip/host of database
-		:param port: database port
-		:param user: database user
-		:param password: database password
+	def connect(self, cursor_type: str = 'realdict'):
+		"""
+		Simple method for database connection (object must have proper config before connecting)
+		:param cursor_type: type of cursor, being 'realdict' or 'dict'
 		:return:
 		"""
-		self.__config['db_name'] = name
-		self.__config['db_host'] = host
-		self.__config['db_port'] = port
-		self.__config['db_user'] = user
-		self.__config['db_pass'] = password
+		# Lock avoids two threads building (and leaking) a pool each on a lazy connect
+		with self.__lock:
+			if not self.connected:
+				# Check if all parameters were set before connecting (empty or missing values are falsy)
+				if all(self._config):
+					# All fine
+					cursor_type = self.__default_cursor if self.__default_cursor else cursor_type
+					# psycopg2.extras is only imported when needed (connecting or batch writing)
+					from psycopg2.extras import RealDictCursor, DictCursor
+					cfactory = RealDictCursor if cursor_type == 'realdict' else DictCursor
+					try:
+						pool = psycopg2.pool.ThreadedConnectionPool(
+							self.__minconn,
+							# One extra slot for the connection pinned to self.connection
+							self.__maxconn + 1,
+							self._dsn,
+							options='-c client_connection_check_interval=2000',
+							# TCP keepalives keep idle pooled connections alive (e.g. across NATs and firewalls)
+							keepalives=1,
+							keepalives_idle=30,
+							keepalives_interval=10,
+							keepalives_count=5,
+							connect_timeout=5,
+							cursor_factory=cfactory)
+					except psycopg2.OperationalError as err:
+						_log.exception('Could not connect to the database _%s_', self._config.db_name)
+						raise err
+					else:
+						# Keeps one pooled connection/cursor pinned to the object (backwards compatibility)
+						connection = pool.getconn()
+						self._pool = pool
+						self.connection = connection
+						self.cursor = connection.cursor()
+						self.connected = True
+						_log.info(
+							'Successfully connected to the Postgres Database _%s_ on %s:%s',
+							self._config.db_name, self._config.db_host, self._config.db_port)
+				else:
+					raise ValueError(
+						'Please, setup connection parameters before trying to connect to a server! '
+						'Tip: run the methods update_config_values or update_config_values_from_json')
 	
-	def update_config_value(self, key: str, value: str):
+	@staticmethod
+	def compile(query: str, **identifiers) -> sql.Composable:
 		"""
-		Method for updating a single config value of object
-		:param key: the key to update
-		:param value: the value of the key
-		:return:
+		Builds a reusable query object (psycopg2.sql), meant to be stored as a constant for hot queries.
+		Identifiers (tables, schemas, columns) are safely quoted, e.g.:
+		compile('SELECT * FROM {table} WHERE id = %s', table=('tenant', 'users'))
+		:param query: the query itself, with {name} fields for identifiers and %s for values
+		:param identifiers: name (str) or qualified name (tuple of str) of each identifier field
+		:return: sql.SQL object (or sql.Composed, if identifiers are passed)
 		"""
-		self.__config[key] = value
+		compiled = sql.SQL(query)
+		if identifiers:
+			compiled = compiled.format(**{
+				field: sql.Identifier(*name) if isinstance(name, tuple) else sql.Identifier(name)
+				for field, name in identifiers.items()})
+		return compiled
 	
-	def update_config_values_from_json(self, config_file: Path = None):
+	@contextmanager
+	def _acquire(self, force: bool = True, autocommit: bool = None):
 		"""
-		Method for updating config values from JSON
-		:param config_file: the JSON file Path
-		:return:
+		Context manager that borrows a connection (and a fresh cursor) from the pool
+		:param force: will attempt to force database connection
+		:param autocommit: autocommit mode of the borrowed connection (defaults to the one set on constructor)
+		:return: tuple with connection and cursor
+		"""
+		# The connection goes back to the pool it came from, even if close() (or a reconnect) happens meanwhile
+		pool = self._pool
+		if pool is None:
+			if not force:
+				raise ConnectionError('There is no Database connected')
+			self.connect()
+			pool = self._pool
+		conn = pool.getconn()
+		try:
+			autocommit = self.__autocommit if autocommit is None else autocommit
+			if conn.autocommit != autocommit:
+				conn.autocommit = autocommit
+			yield conn, conn.cursor()
+		finally:
+			# Broken connections are closed by the pool (instead of being reused), as are the ones returned while
+			# minconn connections are already idle: closed connections are then forgotten by the cache
+			try:
+				pool.putconn(conn, close=bool(conn.closed))
+			except psycopg2.pool.PoolError:
+				# Pool was closed while the connection was borrowed (closeall already closed the connection)
+				if not pool.closed:
+					raise
+				conn.close()
+			if conn.closed:
+				self._stmt_cache.pop(conn, None)
+	
+	def _prepare(self, conn, cur, query: str):
+		"""
+		Looks up (or creates) the server-side prepared statement of a query on the given connection
+		:param conn: connection borrowed from the pool
+		:param cur: cursor of the connection
+		:param query: the query itself
+		:return: tuple with statement name and its EXECUTE query (None if query can not be prepared)
 		"""
-		# Checks if user entered config_file parameter
-		if config_file is None:
-			candidate_file = Path(__file__).parent.joinpath('conn.json')
-		else:
-			candidate_file = config_file
-		# Now, checks if candidate_file exists
-		if candidate_file.is_file():
-			with candidate_file.open('r+') as js:
-				loaded_config = json.load(js)
-			# With json file loaded, we must guarantee that the correct fields exists
-			keys = ('db_name', 'db_host', 'db_port', 'db_user', 'db_pass')
-			if all([key in keys for key in loaded_config]):
-				self.__config['db_name'] = loaded_config['db_name']
-				self.__config['db_host'] = loaded_config['db_host']
-				self.__config['db_port'] = loaded_config['db_port']
-				self.__config['db_user'] = loaded_config['db_user']
-				self.__config['db_pass'] = loaded_config['db_pass']
+		cache = self._stmt_cache.setdefault(conn, OrderedDict())
+		if query in cache:
+			cache.move_to_end(query)
+			return cache[query]
+		entry = None
+		translated = _translate_placeholders(query)
+		words = query.split(None, 1)
+		if translated is not None and words and words[0].upper() in self.__preparable_commands:
+			name = f's{hash(query) & 0xffffffffffffffff:x}'
+			text, params = translated
+			# Inside a transaction a failed PREPARE must not discard the statements that already ran on it
+			in_transaction = conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+			try:
+				if in_transaction:
+					cur.execute('SAVEPOINT dbconn_prepare')
+				cur.execute(f'PREPARE {name} AS {text}')
+			except psycopg2.ProgrammingError:
+				# Not preparable (e.g. parameter types could not be inferred): always run it as a plain query
+				if in_transaction:
+					cur.execute('ROLLBACK TO SAVEPOINT dbconn_prepare')
+				else:
+					conn.rollback()
 			else:
-				raise ValueError(
-					f'The json file ({candidate_file.name}) does not have the '
-					f'needed/correct fields to connect into the DB .\n'
-					f'Needed values: {str(keys)}')
-		else:
-			raise FileNotFoundError(
-				f'Could not find the _{candidate_file.absolute()}_ file')
+				if in_transaction:
+					cur.execute('RELEASE SAVEPOINT dbconn_prepare')
+				if isinstance(params, tuple):
+					args = ', '.join([f'%({param})s' for param in params])
+				else:
+					args = ', '.join(['%s'] * params)
+				entry = (name, f'EXECUTE {name} ({args})' if args else f'EXECUTE {name}')
+		cache[query] = entry
+		if len(cache) > self.__statement_cache_size:
+			_, evicted = cache.popitem(last=False)
+			if evicted is not None:
+				cur.execute(f'DEALLOCATE {evicted[0]}')
+		return entry
+	
+	def _render(self, query: sql.Composable, conn) -> str:
+		"""
+		Renders a composed query (e.g. with identifiers) into its text only once per query object. Pooled
+		connections share the same settings, so the rendered text is valid on any of them
+		:param query: the composed query
+		:param conn: connection used for quoting
+		:return: query text
+		"""
+		key = id(query)
+		cached = self._rendered.get(key)
+		if cached is not None and cached[0]() is query:
+			return cached[1]
+		text = query.as_string(conn)
+		# Entry is dropped as soon as the query object is garbage collected (so its id can not be reused)
+		rendered = self._rendered
+		rendered[key] = (weakref.ref(query, lambda _, k=key: rendered.pop(k, None)), text)
+		return text
 	
-	def update_config_values_from_env(self, env_keys: tuple = None):
+	def _execute(self, conn, cur, query: Union[str, sql.Composable], values: Union[Sequence, Mapping] = None):
 		"""
-		Method for updating config values from environment variables
-		:param env_keys: the keys being used in environment. Tuple is loaded in order:
-			db_name, db_user, db_pass, db_host, db_port (0, 1, 2, 3, 4)
+		Executes a query, using the prepared statement cache for parametrized queries
+		:param conn: connection borrowed from the pool
+		:param cur: cursor of the connection
+		:param query: the query itself
+		:param values: values to pass to query (a sequence, or a dict for %(name)s placeholders)
 		:return:
 		"""
-		# Checks env keys
-		if env_keys is None:
-			env_keys = self.__default_keys
-		elif len(env_keys) != 5:
-			raise AssertionError('Illegal size for env_keys! (!= 5)')
-		self.__config['db_name'] = os.environ.get(env_keys[0])
-		self.__config['db_user'] = os.environ.get(env_keys[1])
-		self.__config['db_pass'] = os.environ.get(env_keys[2])
-		self.__config['db_host'] = os.environ.get(env_keys[3])
-		self.__config['db_port'] = os.environ.get(env_keys[4])
+		if values is None:
+			cur.execute(query)
+			return
+		if self.__statement_cache_size <= 0:
+			cur.execute(query, values)
+			return
+		if not isinstance(query, str):
+			# sql.SQL objects already hold their text, other composables are rendered only once
+			query = query.string if isinstance(query, sql.SQL) else self._render(query, conn)
+		prepared = self._prepare(conn, cur, query)
+		if prepared is None:
+			cur.execute(query, values)
+			return
+		in_transaction = conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+		try:
+			cur.execute(prepared[1], values)
+		except psycopg2.errors.InvalidSqlStatementName:
+			# Statements do not survive between calls: transaction pooling (e.g. pgbouncer), so cache is disabled
+			self.__statement_cache_size = 0
+			self._stmt_cache.clear()
+			if in_transaction:
+				# Rolling back would silently discard the earlier statements of the transaction
+				raise
+			conn.rollback()
+			cur.execute(query, values)
 	
-	def connect(self, cursor_type: str = 'realdict'):
+	def _discard_idle_connections(self):
 		"""
-		Simple method for database connection (object must have proper config before connecting)
-		:param cursor_type: type of cursor, being 'realdict' or 'dict'
+		Closes the idle connections of the pool, so the next borrowed ones are freshly opened
 		:return:
 		"""
-		if not self.connected:
-			# Check if all parameters were set before connecting
-			if all([self.__config[x] != '' for x in self.__config]):
-				# All fine
-				cursor_type = self.__default_cursor if self.__default_cursor else cursor_type
-				cfactory = psycopg2.extras.RealDictCursor if cursor_type == 'realdict' else psycopg2.extras.DictCursor
+		pool = self._pool
+		if pool is not None:
+			# psycopg2 pools have no public API for this: idle connections live on their _pool list
+			with pool._lock:
+				idle, pool._pool = pool._pool, []
+			for conn in idle:
+				conn.close()
+				self._stmt_cache.pop(conn, None)
+	
+	def _execute_with_retry(
+			self, query: Union[str, sql.Composable], values: Union[Sequence, Mapping], force: bool,
+			autocommit: bool = None, fetch_all: bool = None):
+		"""
+		Runs a single query on a pooled connection (committing it unless in autocommit mode). When the connection
+		turns out to be broken, the query is retried once on a freshly opened one, but only if it was running inside
+		a transaction: in autocommit mode the statement may have been committed before the connection broke
+		:param query: the query itself
+		:param values: values to pass to query (a sequence, or a dict for %(name)s placeholders)
+		:param force: will attempt to force database connection
+		:param autocommit: overrides the autocommit mode of the object
+		:param fetch_all: catches all rows (or just a single one), None for not fetching any
+		:return: fetched rows (None when not fetching)
+		"""
+		for retry in (True, False):
+			with self._acquire(force, autocommit) as (conn, cur):
+				in_autocommit = conn.autocommit
 				try:
-					connection = psycopg2.connect(
-						dbname=self.__config['db_name'],
-						host=self.__config['db_host'],
-						port=self.__config['db_port'],
-						user=self.__config['db_user'],
-						password=self.__config['db_pass'],
-						cursor_factory=cfactory)
-				except psycopg2.OperationalError as err:
-					print(
-						f'Could not connect to the database _{self.__config["db_name"]}_')
+					self._execute(conn, cur, query, values)
+				except (psycopg2.InterfaceError, psycopg2.OperationalError) as err:
+					if conn.closed:
+						# After a server restart the idle connections are dead too (and the pool hands them out LIFO)
+						self._discard_idle_connections()
+						if retry and not in_autocommit:
+							continue
+					_log.exception('Could not execute query **%s** with values **%s**', query, values)
 					raise err
-				else:
-					connection.cursor().execute("SET client_connection_check_interval TO 2000")
-					connection.commit()
-					self.connection = connection
-					self.cursor = connection.cursor()
-					self.connected = True
-					print(
-						f'Successfully connected to the Postgres Database '
-						f'_{self.__config["db_name"]}_ on '
-						f'{self.__config["db_host"]}:{self.__config["db_port"]}')
+				rows = None if fetch_all is None else cur.fetchall() if fetch_all else cur.fetchone()
+				if not in_autocommit:
+					conn.commit()
+				return rows
+	
+	def run_query(
+			self, query: Union[str, sql.Composable], values: Union[Sequence, Mapping] = None, force: bool = True,
+			do_print: bool = False):
+		"""
+		Method for running queries on connected database. Obs.: This does not return values, and the query is
+		retried once on a broken connection unless in autocommit mode
+		:param query: the query itself
+		:param values: values to pass to query (a sequence, tuples being preferred, or a dict for %(name)s placeholders)
+		:param force: will attempt to force database connection
+		:param do_print: will log executed query at INFO level (DEBUG otherwise)
+		:return:
+		"""
+		self._execute_with_retry(query, values, force)
+		_log.log(
+			logging.INFO if do_print else logging.DEBUG,
+			'Query **%s** executed in _%s_', query, self._config.db_name)
+	
+	def run_many(self, query: str, rows: list, page_size: int = 500, template: str = None, force: bool = True):
+		"""
+		Method for writing many rows with a single statement per page (psycopg2.extras.execute_values)
+		:param query: the query itself, with a single %s marker for the VALUES list (e.g. INSERT INTO t (a, b) VALUES %s)
+		:param rows: sequence of rows (each one a sequence of values)
+		:param page_size: maximum number of rows sent on each statement
+		:param template: template used to merge each row (e.g. '(%s, %s, 1)'), defaults to one %s per value
+		:param force: will attempt to force database connection
+		:return:
+		"""
+		with self._acquire(force) as (conn, cur):
+			try:
+				from psycopg2.extras import execute_values
+				execute_values(cur, query, rows, template=template, page_size=page_size)
+			except psycopg2.OperationalError as err:
+				_log.exception('Could not execute query _%s_', query)
+				raise err
 			else:
-				raise ValueError(
-					'Please, setup connection parameters before trying to connect to a server! '
-					'Tip: run the methods update_config_values or update_config_values_from_json')
+				conn.commit()
 	
-	def run_query(self, query: str, values: list = None, force: bool = True, do_print: bool = False):
+	def run_batch(self, query: str, rows: list, page_size: int = 500, force: bool = True):
 		"""
-		Method for running queries on connected database. Obs.: This does not return values
+		Method for running the same query (e.g. UPDATE/DELETE) with many sets of values (psycopg2.extras.execute_batch)
 		:param query: the query itself
-		:param values: values to pass to query
+		:param rows: sequence of values (each one passed to the query)
+		:param page_size: maximum number of statements sent on each round-trip
 		:param force: will attempt to force database connection
-		:param do_print: will print returned messages (if there are any)
 		:return:
 		"""
-		if force:
-			if not self.connected:
-				self.connect()
-		if self.connected:
+		with self._acquire(force) as (conn, cur):
 			try:
-				if values is None:
-					self.cursor.execute(query)
-				else:
-					self.cursor.execute(query, values)
-					# TODO: investigate more on psycopg2.sql.SQL and try to update this command with it
+				from psycopg2.extras import execute_batch
+				execute_batch(cur, query, rows, page_size=page_size)
 			except psycopg2.OperationalError as err:
-				print(f'Could not execute query _{query}_')
+				_log.exception('Could not execute query _%s_', query)
 				raise err
 			else:
-				self.connection.commit()
-				if do_print:
-					print(
-						f'Query **{query}** executed in _{self.__config["db_name"]}_')
-		else:
-			raise ConnectionError('There is no Database connected')
+				conn.commit()
 	
-	def run_read_query(self, query: str, values: list = None, force: bool = True, fetch_all: bool = False):
+	def copy_from_iter(self, table: str, columns: list, rows, schema: str = None, force: bool = True):
 		"""
-		Similar to run_query, but returns values obtained from database
+		Method for bulk ingest using COPY ... FROM STDIN (rows are streamed, not loaded at once into memory)
+		:param table: name of the table
+		:param columns: names of the columns, in the same order of the values of each row
+		:param rows: iterable of rows (each one a sequence of values, None being NULL)
+		:param schema: schema of the table (optional)
+		:param force: will attempt to force database connection
+		:return:
+		"""
+		query = sql.SQL('COPY {} ({}) FROM STDIN').format(
+			sql.Identifier(table) if schema is None else sql.Identifier(schema, table),
+			sql.SQL(', ').join(map(sql.Identifier, columns)))
+		with self._acquire(force) as (conn, cur):
+			try:
+				cur.copy_expert(query, _CopyRowsStream(rows))
+			except psycopg2.OperationalError as err:
+				_log.exception('Could not copy rows into _%s_', table)
+				raise err
+			else:
+				conn.commit()
+	
+	def run_read_query(
+			self, query: Union[str, sql.Composable], values: Union[Sequence, Mapping] = None, force: bool = True,
+			fetch_all: bool = False):
+		"""
+		Similar to run_query, but returns values obtained from database. Obs.: runs in autocommit mode, so it is not
+		retried on a broken connection (the statement, e.g. INSERT ... RETURNING, may have been committed already)
 		:param query: the query itself
-		:param values: values to pass to query
+		:param values: values to pass to query (a sequence, tuples being preferred, or a dict for %(name)s placeholders)
 		:param force: will attempt to force database connection
 		:param fetch_all: catches all rows (or just a single one)
 		:return:
 		"""
-		if force:
-			if not self.connected:
-				self.connect()
-		if self.connected:
+		# Read queries do not need a COMMIT round-trip
+		return self._execute_with_retry(query, values, force, autocommit=True, fetch_all=fetch_all)
+	
+	def run_pipeline(self, queries: list, page_size: int = 500, force: bool = True) -> list:
+		"""
+		Method for running many queries back-to-back on a single connection and transaction (a single commit at
+		the end). Consecutive runs of the same query that return no rows (e.g. INSERT/UPDATE) are sent in batches
+		of page_size statements per round-trip (psycopg2.extras.execute_batch), the other queries one by one
+		:param queries: sequence of (query, values) tuples, values being None for queries without parameters
+		:param page_size: maximum number of statements sent on each round-trip
+		:param force: will attempt to force database connection
+		:return: list with the rows returned by each query (None for queries that do not return rows)
+		"""
+		results = []
+		with self._acquire(force) as (conn, cur):
 			try:
-				if values is None:
-					self.cursor.execute(query)
-				else:
-					if type(values) is list:
-						self.cursor.execute(query, values)
+				for query, group in groupby(queries, key=lambda item: item[0]):
+					values = [item[1] for item in group]
+					# The first query tells whether the run returns rows (only those need one round-trip each)
+					self._execute(conn, cur, query, values[0])
+					if cur.description is not None:
+						results.append(cur.fetchall())
+						for item_values in values[1:]:
+							self._execute(conn, cur, query, item_values)
+							results.append(cur.fetchall())
 					else:
-						raise TypeError(f'Values must be a list, not {type(values).__name__}')
+						results.append(None)
+						if len(values) > 1:
+							from psycopg2.extras import execute_batch
+							execute_batch(cur, query, values[1:], page_size=page_size)
+							results.extend([None] * (len(values) - 1))
 			except psycopg2.OperationalError as err:
-				print(f'Could not execute query **{query}** with values **{values}**')
+				_log.exception('Could not execute query _%s_', query)
 				raise err
-			except psycopg2.errors.InFailedSqlTransaction:
-				self.connection.rollback()
-				self.cursor.execute(query, values)
-				result = self.cursor.fetchall() if fetch_all else self.cursor.fetchone()
-				self.connection.commit()
-				return result
-			except Exception as ex:
-				raise ex
 			else:
-				result = self.cursor.fetchall() if fetch_all else self.cursor.fetchone()
-				self.connection.commit()
-				return result
-		raise ConnectionError('There is no Database connected')
+				conn.commit()
+		return results
+	
+	def stream_read_query(
+			self, query: Union[str, sql.Composable], values: Union[Sequence, Mapping] = None, itersize: int = 2000,
+			expected_rows: int = None, force: bool = True):
+		"""
+		Generator that yields the rows of a (large) query using a server-side cursor, fetching itersize rows per
+		round-trip. Obs.: the pooled connection stays busy until the generator is exhausted (or closed)
+		:param query: the query itself
+		:param values: values to pass to query (a sequence, or a dict for %(name)s placeholders)
+		:param itersize: number of rows fetched from the server on each round-trip
+		:param expected_rows: hint of the result size, small results (<= itersize) skip the server-side cursor
+		:param force: will attempt to force database connection
+		:return:
+		"""
+		# Server-side cursors only work inside a transaction, so autocommit is always off here
+		with self._acquire(force, autocommit=False) as (conn, cur):
+			try:
+				if expected_rows is not None and expected_rows <= itersize:
+					self._execute(conn, cur, query, values)
+					yield from cur.fetchall()
+				else:
+					# Server-side cursors only live inside a transaction, which is ended by the commit below
+					with conn.cursor(name=f'ss_{uuid4().hex}', withhold=False) as scur:
+						scur.itersize = itersize
+						scur.execute(query, values)
+						yield from scur
+			except psycopg2.OperationalError as err:
+				_log.exception('Could not execute query **%s** with values **%s**', query, values)
+				raise err
+			finally:
+				if not conn.closed:
+					conn.commit()
 	
 	def close(self):
 		"""
-		Simple method for closing the database connection
+		Simple method for closing the database connection (and every connection of the pool)
 		:return:
 		"""
-		if self.connected:
-			self.connection.close()
-			self.connected = False
-			print(f'Closed connection to _{self.__config["db_name"]}_')
+		with self.__lock:
+			if self.connected:
+				self._pool.putconn(self.connection)
+				self._pool.closeall()
+				self._pool = None
+				self._stmt_cache.clear()
+				self.connection = None
+				self.cursor = None
+				self.connected = False
+				_log.info('Closed connection to _%s_', self._config.db_name)
@@ -48,6 +48,8 @@ setup(
 	install_requires=['psycopg2-binary~=2.9.3'],
 	extras_require={
 		"dev": ["twine>=4.0.2"],
+		"async": ["asyncpg>=0.27.0"],
+		"orjson": ["orjson>=3.8.0"],
 		},
 	python_requires='>=3.9',
 )
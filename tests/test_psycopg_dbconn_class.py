@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Kleydson Stenio <kleydson.stenio@gmail.com>.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+# Imports
+import sys
+import json
+import unittest
+import tempfile
+from pathlib import Path
+from decimal import Decimal
+from datetime import date
+
+# Allows running the tests without installing the package (python -m unittest discover tests)
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath('app')))
+from psycopg2.extensions import parse_dsn
+from psycopg_dbconn_class.src.dbconn_config import DataBaseConfig
+from psycopg_dbconn_class.src.psycopg_dbconn_class import _translate_placeholders, _CopyRowsStream
+
+
+class TranslatePlaceholdersTest(unittest.TestCase):
+	
+	def test_positional(self):
+		self.assertEqual(
+			_translate_placeholders('SELECT * FROM t WHERE a = %s AND b = %s'),
+			('SELECT * FROM t WHERE a = $1 AND b = $2', 2))
+	
+	def test_without_placeholders(self):
+		self.assertEqual(_translate_placeholders('SELECT 1'), ('SELECT 1', 0))
+	
+	def test_escaped_percent(self):
+		self.assertEqual(
+			_translate_placeholders("SELECT * FROM t WHERE a LIKE 'x%%' AND b = %s AND c LIKE '%%s'"),
+			("SELECT * FROM t WHERE a LIKE 'x%' AND b = $1 AND c LIKE '%s'", 1))
+	
+	def test_named(self):
+		self.assertEqual(
+			_translate_placeholders('SELECT %(a)s, %(b)s'),
+			('SELECT $1, $2', ('a', 'b')))
+	
+	def test_repeated_named(self):
+		self.assertEqual(
+			_translate_placeholders('SELECT * FROM t WHERE a = %(x)s OR b = %(y)s OR c = %(x)s'),
+			('SELECT * FROM t WHERE a = $1 OR b = $2 OR c = $1', ('x', 'y')))
+	
+	def test_mixed_placeholders(self):
+		self.assertIsNone(_translate_placeholders('SELECT %s, %(a)s'))
+	
+	def test_unknown_placeholder(self):
+		self.assertIsNone(_translate_placeholders('SELECT %d'))
+
+
+class CopyRowsStreamTest(unittest.TestCase):
+	
+	def test_values(self):
+		stream = _CopyRowsStream([(1, 'a', 2.5, Decimal('1.10'), date(2023, 1, 2), True)])
+		self.assertEqual(stream.read(), '1\ta\t2.5\t1.10\t2023-01-02\tTrue\n')
+	
+	def test_null_and_empty_string(self):
+		self.assertEqual(_CopyRowsStream([(None, '')]).read(), '\\N\t\n')
+	
+	def test_escapes(self):
+		stream = _CopyRowsStream([('tab\there', 'new\nline', 'cr\rhere', 'back\\slash')])
+		self.assertEqual(stream.read(), 'tab\\there\tnew\\nline\tcr\\rhere\tback\\\\slash\n')
+	
+	def test_bytes(self):
+		self.assertEqual(_CopyRowsStream([(b'\x00\xff',)]).read(), '\\\\x00ff\n')
+	
+	def test_unsupported_type(self):
+		with self.assertRaises(TypeError):
+			_CopyRowsStream([([1, 2],)]).read()
+	
+	def test_chunked_read(self):
+		rows = [(i, f'row {i}') for i in range(100)]
+		stream = _CopyRowsStream(iter(rows))
+		chunks = []
+		while True:
+			chunk = stream.read(7)
+			if not chunk:
+				break
+			self.assertLessEqual(len(chunk), 7)
+			chunks.append(chunk)
+		self.assertEqual(''.join(chunks), ''.join([f'{i}\trow {i}\n' for i in range(100)]))
+
+
+class BuildDsnTest(unittest.TestCase):
+	
+	def test_plain_values(self):
+		config = DataBaseConfig()
+		config.update_config_values('db', 'localhost', '5432', 'user', 'secret')
+		self.assertEqual(config._dsn, "dbname='db' host='localhost' port='5432' user='user' password='secret'")
+	
+	def test_escapes(self):
+		config = DataBaseConfig()
+		config.update_config_values('my db', 'localhost', '5432', "o'neil", 'p\\a\'ss word=')
+		self.assertEqual(
+			config._dsn,
+			"dbname='my db' host='localhost' port='5432' user='o\\'neil' password='p\\\\a\\'ss word='")
+		# libpq must read back the original values
+		self.assertEqual(
+			parse_dsn(config._dsn),
+			{'dbname': 'my db', 'host': 'localhost', 'port': '5432', 'user': "o'neil", 'password': 'p\\a\'ss word='})
+	
+	def test_rebuilt_on_single_update(self):
+		config = DataBaseConfig()
+		config.update_config_values('db', 'localhost', '5432', 'user', 'secret')
+		config.update_config_value('db_pass', "it's")
+		self.assertEqual(parse_dsn(config._dsn)['password'], "it's")
+	
+	def test_missing_values(self):
+		config = DataBaseConfig()
+		config.update_config_values('db', None, '5432', 'user', None)
+		self.assertEqual(
+			parse_dsn(config._dsn), {'dbname': 'db', 'host': '', 'port': '5432', 'user': 'user', 'password': ''})
+
+
+class ConfigFromJsonTest(unittest.TestCase):
+	
+	def setUp(self):
+		self.config = DataBaseConfig()
+		self.dir = tempfile.TemporaryDirectory()
+		self.addCleanup(self.dir.cleanup)
+	
+	def _load(self, content) -> None:
+		config_file = Path(self.dir.name).joinpath('conn.json')
+		config_file.write_text(json.dumps(content))
+		self.config.update_config_values_from_json(config_file)
+	
+	def test_valid(self):
+		self._load({'db_name': 'db', 'db_host': 'localhost', 'db_port': '5432', 'db_user': 'user', 'db_pass': "it's"})
+		self.assertEqual(self.config._config.db_name, 'db')
+		self.assertEqual(parse_dsn(self.config._dsn)['password'], "it's")
+	
+	def test_missing_field(self):
+		with self.assertRaises(ValueError):
+			self._load({'db_name': 'db', 'db_host': 'localhost', 'db_port': '5432', 'db_user': 'user'})
+	
+	def test_unknown_field(self):
+		with self.assertRaises(ValueError):
+			self._load({
+				'db_name': 'db', 'db_host': 'localhost', 'db_port': '5432', 'db_user': 'user', 'db_pass': 'secret',
+				'db_schema': 'public'})
+	
+	def test_not_an_object(self):
+		for content in ([1, 2], 'db', None):
+			with self.subTest(content=content), self.assertRaises(ValueError):
+				self._load(content)
+	
+	def test_missing_file(self):
+		with self.assertRaises(FileNotFoundError):
+			self.config.update_config_values_from_json(Path(self.dir.name).joinpath('missing.json'))
+
+
+if __name__ == '__main__':
+	unittest.main()